@@ -1,14 +1,602 @@
-from typing import Dict, Optional, Any, List
-import spotipy
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Literal, Optional, Any, List
+import anyio
+import httpx
+import orjson
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from dotenv import load_dotenv
 from fastmcp import FastMCP
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+
+load_dotenv()
+
+API_BASE = "https://api.spotify.com/v1"
+TOKEN_URL = "https://accounts.spotify.com/api/token"
+
+# Optional app credentials used to pre-warm token-independent catalog data at startup.
+CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
+CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
+
+# Outbound request budget, shared by every tool call.
+RATE_LIMIT = float(os.getenv("SPOTIFY_RATE_LIMIT", "10"))
+RATE_BURST = int(os.getenv("SPOTIFY_RATE_BURST", "20"))
+MAX_CONCURRENCY = int(os.getenv("SPOTIFY_MAX_CONCURRENCY", "64"))
+MAX_RETRIES = 3
+# Tool calls running at once, and how many more may wait before new ones are refused.
+TOOL_CONCURRENCY = int(os.getenv("SPOTIFY_TOOL_CONCURRENCY", "32"))
+TOOL_QUEUE = int(os.getenv("SPOTIFY_TOOL_QUEUE", "256"))
+
+# Columns returned by get_audio_features(return_format="soa").
+AUDIO_FEATURE_COLUMNS = (
+    "id", "danceability", "energy", "key", "loudness", "mode", "speechiness", "acousticness",
+    "instrumentalness", "liveness", "valence", "tempo", "duration_ms", "time_signature",
+)
+
+# Markets searched by search_markets when the caller does not pass any.
+COUNTRY_CODES = (
+    "AD", "AR", "AU", "AT", "BE", "BO", "BR", "BG", "CA", "CL", "CO", "CR", "CY", "CZ", "DK",
+    "DO", "EC", "SV", "EE", "FI", "FR", "DE", "GR", "GT", "HN", "HK", "HU", "IS", "ID", "IE",
+    "IT", "JP", "LV", "LI", "LT", "LU", "MY", "MT", "MX", "MC", "NL", "NZ", "NI", "NO", "PA",
+    "PY", "PE", "PH", "PL", "PT", "SG", "ES", "SK", "SE", "CH", "TW", "TR", "GB", "US", "UY",
+)
+
+_URI_RE = re.compile(r"^spotify:(?:(?P<type>track|artist|album|playlist|show|episode|audiobook|user):(?P<id>[0-9A-Za-z_.-]+)|user:[^:]+:playlist:(?P<playlistid>[0-9A-Za-z]+))$")
+_URL_RE = re.compile(r"^(?:https?://)?open\.spotify\.com/(?:intl-\w\w/)?(?P<type>track|artist|album|playlist|show|episode|user|audiobook)/(?P<id>[0-9A-Za-z_.-]+)(?:\?.*)?$")
+# Bare IDs are base62; user IDs may also contain "_", "." and "-", but never consist of dots alone.
+_ID_RE = re.compile(r"^[0-9A-Za-z]+$")
+_USER_ID_RE = re.compile(r"^(?!\.+$)[0-9A-Za-z_.-]+$")
+# Browse category IDs are either base62 or legacy slugs such as in_the_car.
+_CATEGORY_ID_RE = re.compile(r"^[0-9A-Za-z_]+$")
+# Search operators, which Spotify only recognises in upper case.
+_SEARCH_OPERATORS = frozenset({"NOT", "OR"})
+
+_session: Optional[httpx.AsyncClient] = None
+_background_tasks: set = set()
+_inflight: Dict[tuple, "asyncio.Future[Any]"] = {}
+
+# Tool response caches. Catalog data changes over hours, markets and genre
+# seeds over days, and search results carry Cache-Control: max-age=120.
+# Profiles, playlists and top items change over minutes; playback state and
+# devices over seconds, so agents polling them only absorb repeated calls.
+# ttl_cached stores (result, JSON size) and the caches are bounded by total
+# size, so that fetch_all results cannot grow them without limit.
+CATALOG_CACHE: TTLCache = TTLCache(maxsize=64 * 1024 * 1024, ttl=3600, getsizeof=lambda entry: entry[1])
+STATIC_CACHE: TTLCache = TTLCache(maxsize=16, ttl=86400)
+SEARCH_CACHE: TTLCache = TTLCache(maxsize=32 * 1024 * 1024, ttl=120, getsizeof=lambda entry: entry[1])
+USER_CACHE: TTLCache = TTLCache(maxsize=32 * 1024 * 1024, ttl=300, getsizeof=lambda entry: entry[1])
+PLAYER_CACHE: TTLCache = TTLCache(maxsize=4 * 1024 * 1024, ttl=5, getsizeof=lambda entry: entry[1])
+# Token-independent endpoints kept in STATIC_CACHE and refreshed in the background.
+STATIC_PATHS = ("markets", "recommendations/available-genre-seeds")
+# Seconds before a failed pre-warm of STATIC_PATHS is retried.
+STATIC_RETRY = 60
+
+# Last (ETag, body, body size) seen per (token hash, path, query), replayed on 304
+# Not Modified. Bounded by the total size of the raw response bodies it holds.
+ETAG_CACHE: TTLCache = TTLCache(maxsize=32 * 1024 * 1024, ttl=3600, getsizeof=lambda entry: entry[2])
+# (page, JSON size) fetched ahead of the caller by _get_page, consumed by follow-up
+# requests. Bounded by the total JSON size of the pages it holds.
+PAGE_CACHE: TTLCache = TTLCache(maxsize=16 * 1024 * 1024, ttl=60, getsizeof=lambda entry: entry[1])
+PREFETCH_PAGES = 2
+# Default server-side projections for the playlist tools; they cut the payload to what callers typically read.
+PLAYLIST_ITEM_FIELDS = "items(track(id,uri,type,name,artists(id,name),duration_ms,album(id,name),show(id,name))),next,total,limit,offset"
+PLAYLIST_FIELDS = f"id,name,description,owner(id,display_name),snapshot_id,tracks({PLAYLIST_ITEM_FIELDS})"
+# Top-level API resources whose responses are revalidated with If-None-Match.
+# Keys include the token hash, so "me" responses are never shared between users.
+_ETAG_RESOURCES = frozenset({"albums", "artists", "tracks", "playlists", "shows", "episodes", "audiobooks", "browse", "markets", "users", "me"})
+# Paths under those resources that change too often for revalidation to pay off.
+_ETAG_SKIP = ("me/player",)
+
+class SpotifyAPIError(Exception):
+    """Raised when the Spotify Web API answers with an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"http status: {status}, {message}")
+        self.status = status
+
+class ServerBusyError(Exception):
+    """Raised when a tool call is refused because TOOL_QUEUE calls are already waiting."""
+
+class LeakyBucket:
+    """
+    Token bucket pacing outbound requests to `rate` per second, with bursts of up to `capacity`.
+
+    A 429 from Spotify calls pause(), which holds every caller until the Retry-After window has passed.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    self._updated = time.monotonic()
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+RATE = LeakyBucket(rate=RATE_LIMIT, capacity=RATE_BURST)
+SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+TOOL_SEM = asyncio.Semaphore(TOOL_CONCURRENCY)
+_queued_tools = 0
+
+def get_session() -> httpx.AsyncClient:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None or _session.is_closed:
+        _session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            timeout=30,
+            headers={"Accept-Encoding": "gzip, deflate, br"},
+        )
+    return _session
 
-mcp = FastMCP("Spotipy MCP Server")
-
-def get_spotify_client(token: str) -> spotipy.Spotify:
-    return spotipy.Spotify(auth=token)
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    refresher = asyncio.create_task(_refresh_static()) if CLIENT_ID and CLIENT_SECRET else None
+    try:
+        yield
+    finally:
+        if refresher is not None:
+            refresher.cancel()
+        if _session is not None and not _session.is_closed:
+            await _session.aclose()
+
+mcp = FastMCP("Spotipy MCP Server", lifespan=lifespan)
+
+logger = logging.getLogger(__name__)
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+def _request_key(token: str, path: str, query: Optional[Dict[str, Any]]) -> tuple:
+    return (_token_key(token), path, tuple(sorted(query.items())) if query else ())
+
+def _spawn(coro: Awaitable[Any]) -> None:
+    """Run `coro` in the background, keeping a reference until it finishes."""
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+def tool_error(message: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Turn any exception raised by an async tool into {"error": "<message>: <exception>"}."""
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                return {"error": f"{message}: {e}"}
+
+        return wrapper
+    return decorator
+
+def with_backpressure(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Run an async tool under TOOL_SEM, raising ServerBusyError once TOOL_QUEUE calls are waiting.
+
+    At most TOOL_CONCURRENCY tools run at once, so a flood of calls cannot pile up
+    in memory. Placed below ttl_cached so that cache hits are never held back;
+    tools that read a cached helper apply it to the helper instead.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        global _queued_tools
+        if TOOL_SEM.locked() and _queued_tools >= TOOL_QUEUE:
+            raise ServerBusyError("server busy, retry later")
+        _queued_tools += 1
+        try:
+            await TOOL_SEM.acquire()
+        finally:
+            _queued_tools -= 1
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            TOOL_SEM.release()
+
+    return wrapper
+
+def _normalize_query(query: str) -> str:
+    """
+    Canonical form of a search query for cache keys.
+
+    Case and whitespace are folded and field filters such as artist:, year: or
+    genre: are sorted after the free-text terms, since Spotify treats neither
+    ordering nor case as significant. The operators NOT and OR only count in
+    upper case and bind to the terms next to them, so a query that uses them
+    only has its whitespace collapsed.
+    """
+    terms = re.findall(r'\w+:"[^"]*"|\w+:\S+|"[^"]*"|\S+', query)
+    if any(t in _SEARCH_OPERATORS for t in terms):
+        return " ".join(terms)
+    terms = [t.casefold() for t in terms]
+    free = [t for t in terms if not re.match(r"\w+:", t)]
+    filters = sorted(t for t in terms if re.match(r"\w+:", t))
+    return " ".join(free + filters)
+
+def ttl_cached(cache: TTLCache, **normalizers: Callable[[Any], Any]) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Memoise an async tool in `cache`, keyed by the token hash and the remaining bound arguments.
+
+    `normalizers` map argument names to functions applied to that argument when
+    building the key, so that equivalent spellings share an entry. Results are
+    stored as (result, JSON size) for size-bounded caches, and results larger
+    than the whole cache are not stored. Exceptions propagate and are never cached.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            token = arguments.pop("token")
+            for name, normalize in normalizers.items():
+                arguments[name] = normalize(arguments[name])
+            key = hashkey(fn.__name__, _token_key(token), *((k, tuple(v) if isinstance(v, list) else v) for k, v in arguments.items()))
+            try:
+                return cache[key][0]
+            except KeyError:
+                pass
+            result = await fn(*args, **kwargs)
+            size = len(orjson.dumps(result))
+            if size <= cache.maxsize:
+                cache[key] = (result, size)
+            return result
+
+        return wrapper
+    return decorator
+
+def _get_id(type: str, id: str) -> str:
+    """
+    Extract the bare Spotify ID from an ID, URI or open.spotify.com URL.
+
+    Raises ValueError for a URI or URL of another type, and for anything that is
+    not a valid ID, so that callers can interpolate the result into a URL path.
+    """
+    bare = id
+    match = _URI_RE.match(id)
+    if match is not None:
+        if match.group("playlistid") is not None:
+            if type != "playlist":
+                raise ValueError(f"Unexpected Spotify URI type, expected {type}: {id}")
+            return match.group("playlistid")
+        if match.group("type") != type:
+            raise ValueError(f"Unexpected Spotify URI type, expected {type}: {id}")
+        bare = match.group("id")
+    else:
+        match = _URL_RE.match(id)
+        if match is not None:
+            if match.group("type") != type:
+                raise ValueError(f"Unexpected Spotify URL type, expected {type}: {id}")
+            bare = match.group("id")
+
+    if (_USER_ID_RE if type == "user" else _ID_RE).match(bare) is None:
+        raise ValueError(f"Unsupported Spotify {type} ID: {id}")
+    return bare
+
+def _get_category_id(category_id: str) -> str:
+    """Check a browse category ID before it is interpolated into a URL path."""
+    if _CATEGORY_ID_RE.match(category_id) is None:
+        raise ValueError(f"Unsupported Spotify category ID: {category_id}")
+    return category_id
+
+def _get_uri(type: str, id: str) -> str:
+    return f"spotify:{type}:{_get_id(type, id)}"
+
+async def _get(session: httpx.AsyncClient, path: str, params: Optional[Dict[str, Any]], token: str) -> Any:
+    """
+    Issue a GET against the Spotify Web API and return the decoded JSON body.
+
+    Parameters whose value is None are dropped. Empty (204) responses return None.
+    Identical requests already in flight are coalesced: later callers await the
+    first caller's fetch instead of issuing their own. Returned objects may be
+    shared with other callers and with ETAG_CACHE and must not be mutated.
+    """
+    query = {k: v for k, v in params.items() if v is not None} if params else None
+    key = _request_key(token, path, query)
+    task = _inflight.get(key)
+    if task is None:
+        task = _inflight[key] = asyncio.ensure_future(_fetch(session, path, query, token))
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+async def _fetch(session: httpx.AsyncClient, path: str, query: Optional[Dict[str, Any]], token: str) -> Any:
+    """
+    Perform a single GET for _get(), with pacing, 429 retries and ETag revalidation.
+
+    Requests are paced by RATE and bounded by SEM; a 429 pauses the bucket for
+    the Retry-After window (or an exponential backoff) and is retried up to
+    MAX_RETRIES times. Paths under _ETAG_RESOURCES (except _ETAG_SKIP) are
+    revalidated with If-None-Match, and a 304 returns the body cached in ETAG_CACHE.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    etag_key = None
+    cached = None
+    if path.split("/", 1)[0] in _ETAG_RESOURCES and not path.startswith(_ETAG_SKIP):
+        etag_key = _request_key(token, path, query)
+        cached = ETAG_CACHE.get(etag_key)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+    for attempt in range(MAX_RETRIES + 1):
+        async with SEM:
+            await RATE.acquire()
+            resp = await session.get(f"{API_BASE}/{path}", headers=headers, params=query)
+        if resp.status_code == 429 and attempt < MAX_RETRIES:
+            RATE.pause(max(_retry_after(resp.headers), 2 ** attempt))
+            continue
+        if resp.status_code == 304 and cached is not None:
+            return cached[1]
+        if resp.status_code == 204:
+            return None
+        try:
+            data = orjson.loads(resp.content) if resp.content else None
+        except orjson.JSONDecodeError:
+            data = None
+        if resp.status_code >= 400:
+            error = data.get("error") if isinstance(data, dict) else None
+            message = error.get("message") if isinstance(error, dict) else error
+            raise SpotifyAPIError(resp.status_code, message or resp.reason_phrase or "request failed")
+        etag = resp.headers.get("ETag")
+        size = len(resp.content)
+        if etag_key is not None and etag and size <= ETAG_CACHE.maxsize:
+            ETAG_CACHE[etag_key] = (etag, data, size)
+        return data
+
+def _retry_after(headers: Any) -> float:
+    try:
+        return float(headers.get("Retry-After", 0))
+    except ValueError:
+        return 0.0
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+async def _batched(session: httpx.AsyncClient, path: str, key: str, ids: List[str], chunk: int, params: Optional[Dict[str, Any]], token: str) -> Dict[str, Any]:
+    """
+    Fetch a multi-ID endpoint in slices of at most `chunk` IDs, concurrently.
+
+    Spotify caps how many IDs each of these endpoints accepts, so the list is
+    split into API-sized slices, dispatched with asyncio.gather and the `key`
+    arrays of the responses are concatenated in request order.
+    """
+    pages = await asyncio.gather(*[
+        _get(session, path, {**(params or {}), "ids": ",".join(c)}, token) for c in _chunks(ids, chunk)
+    ])
+    return {key: [item for page in pages for item in page[key]]}
+
+async def _contains(session: httpx.AsyncClient, path: str, param: str, values: List[str], chunk: int, token: str) -> List[bool]:
+    """Run a "contains" check in concurrent slices of at most `chunk` values and join the boolean lists in order."""
+    pages = await asyncio.gather(*[_get(session, path, {param: ",".join(c)}, token) for c in _chunks(values, chunk)])
+    return [flag for page in pages for flag in page]
+
+def _with_paging_fields(fields: str) -> str:
+    """Add `items` and `total` to a `fields` projection that leaves them out at the top level."""
+    names = set()
+    depth = 0
+    start = 0
+    for i, char in enumerate(fields + ","):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            names.add(re.split(r"[(.]", fields[start:i], maxsplit=1)[0].strip())
+            start = i + 1
+    missing = [name for name in ("items", "total") if name not in names]
+    return ",".join([fields, *missing])
+
+async def _paginate_all(session: httpx.AsyncClient, path: str, params: Optional[Dict[str, Any]], token: str, page_size: int, offset: int = 0, key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch every page of an offset-paginated endpoint, starting at `offset`.
+
+    The first page is requested to learn `total`; the remaining pages are then
+    requested concurrently and their items merged into a copy of the first page,
+    which is returned with `next` cleared. `key` names the wrapper object for endpoints
+    that nest the paging object, e.g. {"playlists": {...}}. A `fields` projection
+    is widened to keep `items` and `total`, and a page without `total` raises
+    ValueError rather than passing one page off as all of them.
+    """
+    params = params or {}
+    if params.get("fields"):
+        params = {**params, "fields": _with_paging_fields(params["fields"])}
+    first = await _get(session, path, {**params, "limit": page_size, "offset": offset}, token)
+    page = first[key] if key else first
+    if page.get("total") is None:
+        raise ValueError(f"{path} returned no total, so the remaining pages cannot be fetched")
+    offsets = range(offset + page_size, page["total"], page_size)
+    rest = await asyncio.gather(*[
+        _get(session, path, {**params, "limit": page_size, "offset": o}, token) for o in offsets
+    ])
+    items = list(page["items"])
+    for extra in rest:
+        items.extend((extra[key] if key else extra)["items"])
+    page = {**page, "items": items, "next": None}
+    return {**first, key: page} if key else page
+
+async def _get_page(session: httpx.AsyncClient, path: str, params: Dict[str, Any], token: str, key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Fetch one page of an offset-paginated endpoint, serving it from PAGE_CACHE when it was prefetched.
+
+    When the page has a `next` link, the following PREFETCH_PAGES pages are requested in the
+    background so that a caller walking the offsets finds them already cached. `params` must
+    contain `limit` and `offset`; `key` names the wrapper object for nested paging objects.
+    """
+    query = {k: v for k, v in params.items() if v is not None}
+    cached = PAGE_CACHE.get(_request_key(token, path, query))
+    if cached is not None:
+        results = cached[0]
+    else:
+        results = await _get(session, path, params, token)
+    page = results.get(key) if key and isinstance(results, dict) else results
+    if isinstance(page, dict) and page.get("next"):
+        _spawn(_prefetch(session, path, query, token, page.get("total") or 0))
+    return results
+
+async def _prefetch(session: httpx.AsyncClient, path: str, query: Dict[str, Any], token: str, total: int) -> None:
+    limit, offset = query["limit"], query["offset"]
+    pending = []
+    for n in range(1, PREFETCH_PAGES + 1):
+        following = {**query, "offset": offset + n * limit}
+        if following["offset"] >= total or _request_key(token, path, following) in PAGE_CACHE:
+            continue
+        pending.append(following)
+    pages = await asyncio.gather(*[_get(session, path, q, token) for q in pending], return_exceptions=True)
+    for following, page in zip(pending, pages):
+        if isinstance(page, BaseException):
+            continue
+        size = len(orjson.dumps(page))
+        if size <= PAGE_CACHE.maxsize:
+            PAGE_CACHE[_request_key(token, path, following)] = (page, size)
+
+async def _static(session: httpx.AsyncClient, path: str, token: str) -> Any:
+    """Return token-independent catalog data from STATIC_CACHE, fetching it with `token` on a miss."""
+    try:
+        return STATIC_CACHE[path]
+    except KeyError:
+        pass
+    data = await _get(session, path, None, token)
+    STATIC_CACHE[path] = data
+    return data
+
+async def _app_token(session: httpx.AsyncClient) -> str:
+    """Obtain an app access token through the client credentials flow."""
+    resp = await session.post(TOKEN_URL, data={"grant_type": "client_credentials"}, auth=(CLIENT_ID, CLIENT_SECRET))
+    data = orjson.loads(resp.content)
+    if resp.status_code >= 400:
+        raise SpotifyAPIError(resp.status_code, data.get("error_description") or data.get("error") or "token request failed")
+    return data["access_token"]
+
+async def _refresh_static() -> None:
+    """
+    Keep STATIC_PATHS warm in STATIC_CACHE.
+
+    Entries are refreshed at 90% of the cache lifetime so they never expire
+    between refreshes; after any failure the refresh is retried in
+    STATIC_RETRY seconds instead of waiting a full lifetime.
+    """
+    while True:
+        session = get_session()
+        failed = False
+        try:
+            token = await _app_token(session)
+            for path in STATIC_PATHS:
+                try:
+                    STATIC_CACHE[path] = await _get(session, path, None, token)
+                except SpotifyAPIError as e:
+                    failed = True
+                    logger.warning("Could not pre-warm %s: %s", path, e)
+        except Exception as e:
+            failed = True
+            logger.warning("Could not pre-warm static catalog data: %s", e)
+        await asyncio.sleep(STATIC_RETRY if failed else STATIC_CACHE.ttl * 0.9)
+
+async def _search(session: httpx.AsyncClient, query: str, types: List[str], limit: int, offset: int, market: Optional[str], token: str) -> Dict[str, Any]:
+    """Search several item types in one round-trip; the response has one paging object per type."""
+    return await _get(session, "search", {"q": query, "type": ",".join(types), "limit": limit, "offset": offset, "market": market}, token)
+
+async def _search_multiple_markets(session: httpx.AsyncClient, query: str, limit: int, offset: int, type: str, markets: List[str], total: Optional[int], token: str) -> Dict[str, Any]:
+    """
+    Run the same search in several markets and collect the results per market.
+
+    Without `total` every market is searched concurrently. With `total` the
+    markets are searched one after another, shrinking the limit as results come
+    in and stopping once `total` items have been collected across all markets
+    and types, so no request is spent on results that would be discarded.
+    """
+    item_types = [t + "s" for t in type.split(",")]
+    if not total:
+        pages = await asyncio.gather(*[
+            _get(session, "search", {"q": query, "limit": limit, "offset": offset, "type": type, "market": m}, token) for m in markets
+        ])
+        return {market: {item_type: page[item_type] for item_type in item_types} for market, page in zip(markets, pages)}
+
+    if limit > total:
+        limit = total
+    results: Dict[str, Any] = {}
+    count = 0
+    for market in markets:
+        page = await _get(session, "search", {"q": query, "limit": limit, "offset": offset, "type": type, "market": market}, token)
+        results[market] = {}
+        for item_type in item_types:
+            found = page[item_type]
+            if len(found["items"]) > limit:
+                found = {**found, "items": found["items"][:limit]}
+            results[market][item_type] = found
+            count += len(found["items"])
+            if limit > total - count:
+                limit = total - count
+        if count >= total:
+            break
+    return results
+
+# Fields of me/player that me/player/currently-playing also returns.
+_CURRENTLY_PLAYING_KEYS = ("timestamp", "context", "progress_ms", "item", "currently_playing_type", "actions", "is_playing")
+
+def _normalize_additional_types(additional_types: Optional[str]) -> str:
+    """Spell out the API's default of "track" so omitted and explicit requests share a cache entry."""
+    return additional_types or "track"
+
+@ttl_cached(PLAYER_CACHE, additional_types=_normalize_additional_types)
+@with_backpressure
+async def _player_state(token: str, market: Optional[str], additional_types: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Fetch me/player once for all playback tools; currently-playing is a projection of it."""
+    return await _get(get_session(), "me/player", {"market": market, "additional_types": _normalize_additional_types(additional_types)}, token)
+
+async def _currently_playing(token: str, market: Optional[str], additional_types: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Project the currently playing fields out of _player_state.
+
+    me/player needs the user-read-playback-state scope; tokens granted only
+    user-read-currently-playing are answered with 401/403, in which case
+    me/player/currently-playing is fetched instead.
+    """
+    try:
+        state = await _player_state(token, market, additional_types)
+    except SpotifyAPIError as e:
+        if e.status not in (401, 403):
+            raise
+        return await _currently_playing_only(token, market, additional_types)
+    return {key: state.get(key) for key in _CURRENTLY_PLAYING_KEYS} if state else None
+
+@ttl_cached(PLAYER_CACHE, additional_types=_normalize_additional_types)
+@with_backpressure
+async def _currently_playing_only(token: str, market: Optional[str], additional_types: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Fetch me/player/currently-playing for tokens that lack the user-read-playback-state scope."""
+    return await _get(get_session(), "me/player/currently-playing", {"market": market, "additional_types": _normalize_additional_types(additional_types)}, token)
 
 @mcp.tool()
-def get_album_info(token: str, album_id: str, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get album info")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_album_info(token: str, album_id: str, market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a single album given the album's ID, URIs or URL.
 
@@ -19,16 +607,14 @@ def get_album_info(token: str, album_id: str, market: Optional[str] = None) -> D
     Returns:
         Dictionary containing detailed album information
     """
-    try:
-        spotify = get_spotify_client(token)
-        album = spotify.album(album_id, market=market)
-        return album
-
-    except Exception as e:
-        return {"error": f"Failed to get album info: {str(e)}"}
+    session = get_session()
+    album = await _get(session, f"albums/{_get_id('album', album_id)}", {"market": market}, token)
+    return album
 
 @mcp.tool()
-def get_album_tracks(token: str, album_id: str, limit: int = 50, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get album tracks")
+@with_backpressure
+async def get_album_tracks(token: str, album_id: str, limit: int = 50, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get Spotify catalog information about an album's tracks.
 
@@ -37,20 +623,23 @@ def get_album_tracks(token: str, album_id: str, limit: int = 50, offset: int = 0
         album_id: The album ID, URI or URL
         limit: The number of items to return
         offset: The index of the first item to return
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing album tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.album_tracks(album_id, limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get album tracks: {str(e)}"}
+    session = get_session()
+    path = f"albums/{_get_id('album', album_id)}/tracks"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def get_albums(token: str, albums: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get albums")
+@with_backpressure
+async def get_albums(token: str, albums: List[str], market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a list of albums given the album IDs, URIs, or URLs.
 
@@ -62,16 +651,15 @@ def get_albums(token: str, albums: List[str], market: Optional[str] = None) -> D
     Returns:
         Dictionary containing album information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.albums(albums, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get albums: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "albums", "albums", [_get_id("album", a) for a in albums], 20, {"market": market}, token)
+    return results
 
 @mcp.tool()
-def get_artist_info(token: str, artist_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get artist info")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_artist_info(token: str, artist_id: str) -> Dict[str, Any]:
     """
     Returns a single artist given the artist's ID, URI or URL.
 
@@ -82,16 +670,14 @@ def get_artist_info(token: str, artist_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing detailed artist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        artist = spotify.artist(artist_id)
-        return artist
-
-    except Exception as e:
-        return {"error": f"Failed to get artist info: {str(e)}"}
+    session = get_session()
+    artist = await _get(session, f"artists/{_get_id('artist', artist_id)}", None, token)
+    return artist
 
 @mcp.tool()
-def get_artist_albums(token: str, artist_id: str, album_type: Optional[str] = None, include_groups: Optional[str] = None, country: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get artist albums")
+@with_backpressure
+async def get_artist_albums(token: str, artist_id: str, album_type: Optional[str] = None, include_groups: Optional[str] = None, country: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get Spotify catalog information about an artist's albums.
 
@@ -101,20 +687,23 @@ def get_artist_albums(token: str, artist_id: str, album_type: Optional[str] = No
         album_type: The types of items to return. One or more of 'album', 'single', 'appears_on', 'compilation'
         limit: The number of albums to return
         offset: The index of the first album to return
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing artist's albums
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.artist_albums(artist_id, album_type=album_type, include_groups=include_groups, country=country, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get artist albums: {str(e)}"}
+    session = get_session()
+    path = f"artists/{_get_id('artist', artist_id)}/albums"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"include_groups": include_groups or album_type, "market": country}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"include_groups": include_groups or album_type, "market": country, "limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_artist_related_artists(token: str, artist_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get related artists")
+@with_backpressure
+async def get_artist_related_artists(token: str, artist_id: str) -> Dict[str, Any]:
     """
     Get Spotify catalog information about artists similar to an identified artist. Similarity is based on analysis of the Spotify community's listening history.
 
@@ -125,16 +714,14 @@ def get_artist_related_artists(token: str, artist_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing related artists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.artist_related_artists(artist_id)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get related artists: {str(e)}"}
+    session = get_session()
+    results = await _get(session, f"artists/{_get_id('artist', artist_id)}/related-artists", None, token)
+    return results
 
 @mcp.tool()
-def get_artist_top_tracks(token: str, artist_id: str, country: str = "US") -> Dict[str, Any]:
+@tool_error("Failed to get artist top tracks")
+@with_backpressure
+async def get_artist_top_tracks(token: str, artist_id: str, country: str = "US") -> Dict[str, Any]:
     """
     Get Spotify catalog information about an artist's top 10 tracks by country.
 
@@ -146,16 +733,14 @@ def get_artist_top_tracks(token: str, artist_id: str, country: str = "US") -> Di
     Returns:
         Dictionary containing artist's top tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.artist_top_tracks(artist_id, country=country)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get artist top tracks: {str(e)}"}
+    session = get_session()
+    results = await _get(session, f"artists/{_get_id('artist', artist_id)}/top-tracks", {"market": country}, token)
+    return results
 
 @mcp.tool()
-def get_artists(token: str, artists: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to get artists")
+@with_backpressure
+async def get_artists(token: str, artists: List[str]) -> Dict[str, Any]:
     """
     Returns a list of artists given the artist IDs, URIs, or URLs.
 
@@ -166,16 +751,14 @@ def get_artists(token: str, artists: List[str]) -> Dict[str, Any]:
     Returns:
         Dictionary containing artist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.artists(artists)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get artists: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "artists", "artists", [_get_id("artist", a) for a in artists], 50, None, token)
+    return results
 
 @mcp.tool()
-def get_audio_analysis(token: str, track_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get audio analysis")
+@with_backpressure
+async def get_audio_analysis(token: str, track_id: str) -> Dict[str, Any]:
     """
     Get audio analysis for a track based upon its Spotify ID.
 
@@ -186,36 +769,36 @@ def get_audio_analysis(token: str, track_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing detailed audio analysis
     """
-    try:
-        spotify = get_spotify_client(token)
-        analysis = spotify.audio_analysis(track_id)
-        return analysis
-
-    except Exception as e:
-        return {"error": f"Failed to get audio analysis: {str(e)}"}
+    session = get_session()
+    analysis = await _get(session, f"audio-analysis/{_get_id('track', track_id)}", None, token)
+    return analysis
 
 @mcp.tool()
-def get_audio_features(token: str, tracks: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to get audio features")
+@with_backpressure
+async def get_audio_features(token: str, tracks: List[str], return_format: Literal["aos", "soa"] = "aos") -> Dict[str, Any]:
     """
     Get audio features for one or multiple tracks based upon their Spotify IDs.
 
     Args:
         token: Spotify user token
-        track_id: A list of track URIs, URLs or IDs, maximum: 100 ids
+        track_id: A list of track URIs, URLs or IDs. Lists longer than 100 ids are fetched in concurrent batches
+        return_format: 'aos' for Spotify's {"audio_features": [...]} response with one object per track, or 'soa' for one list per feature (id, danceability, energy, ...) aligned by track, ready for columnar analysis
 
     Returns:
         Dictionary containing audio features
     """
-    try:
-        spotify = get_spotify_client(token)
-        features = spotify.audio_features(tracks)
-        return features if features else {"audio_features": None}
-
-    except Exception as e:
-        return {"error": f"Failed to get audio features: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "audio-features", "audio_features", [_get_id("track", t) for t in tracks], 100, None, token)
+    if return_format == "soa":
+        rows = results.get("audio_features") or []
+        return {column: [row.get(column) if row else None for row in rows] for column in AUDIO_FEATURE_COLUMNS}
+    return results
 
 @mcp.tool()
-def get_available_markets(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get available markets")
+@with_backpressure
+async def get_available_markets(token: str) -> Dict[str, Any]:
     """    Get the list of markets where Spotify is available. Returns a list of the countries in which Spotify is available, identified by their ISO 3166-1 alpha-2 country code with additional country codes for special territories.
 
     Args:
@@ -224,16 +807,15 @@ def get_available_markets(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing available markets
     """
-    try:
-        spotify = get_spotify_client(token)
-        markets = spotify.available_markets()
-        return markets
-
-    except Exception as e:
-        return {"error": f"Failed to get available markets: {str(e)}"}
+    session = get_session()
+    markets = await _static(session, "markets", token)
+    return markets
 
 @mcp.tool()
-def get_categories(token: str, country: Optional[str] = None, locale: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get categories")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_categories(token: str, country: Optional[str] = None, locale: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get a list of categories.
 
@@ -242,20 +824,24 @@ def get_categories(token: str, country: Optional[str] = None, locale: Optional[s
         country: An ISO 3166-1 alpha-2 country code
         limit: The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50
         offset: The index of the first item to return. Default: 0 (the first object). Use with limit to get the next set of items
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing browse categories
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.categories(country=country, locale=locale, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get categories: {str(e)}"}
+    session = get_session()
+    path = "browse/categories"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"country": country, "locale": locale}, token, limit, offset, key="categories")
+    else:
+        results = await _get_page(session, path, {"country": country, "locale": locale, "limit": limit, "offset": offset}, token, key="categories")
+    return results
 
 @mcp.tool()
-def get_category(token: str, category_id: str, country: Optional[str] = None, locale: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get category")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_category(token: str, category_id: str, country: Optional[str] = None, locale: Optional[str] = None) -> Dict[str, Any]:
     """
     Get info about a category.
 
@@ -267,16 +853,14 @@ def get_category(token: str, category_id: str, country: Optional[str] = None, lo
     Returns:
         Dictionary containing category information
     """
-    try:
-        spotify = get_spotify_client(token)
-        category = spotify.category(category_id, country=country, locale=locale)
-        return category
-
-    except Exception as e:
-        return {"error": f"Failed to get category: {str(e)}"}
+    session = get_session()
+    category = await _get(session, f"browse/categories/{_get_category_id(category_id)}", {"country": country, "locale": locale}, token)
+    return category
 
 @mcp.tool()
-def get_category_playlists(token: str, category_id: str, country: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get category playlists")
+@with_backpressure
+async def get_category_playlists(token: str, category_id: str, country: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get a list of playlists for a specific Spotify category.
 
@@ -286,20 +870,23 @@ def get_category_playlists(token: str, category_id: str, country: Optional[str]
         country: An ISO 3166-1 alpha-2 country code
         limit: The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50
         offset: The index of the first item to return. Default: 0 (the first object). Use with limit to get the next set of items
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing category playlists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.category_playlists(category_id, country=country, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get category playlists: {str(e)}"}
+    session = get_session()
+    path = f"browse/categories/{_get_category_id(category_id)}/playlists"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"country": country}, token, limit, offset, key="playlists")
+    else:
+        results = await _get_page(session, path, {"country": country, "limit": limit, "offset": offset}, token, key="playlists")
+    return results
 
 @mcp.tool()
-def get_episode(token: str, episode_id: str, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get episode")
+@with_backpressure
+async def get_episode(token: str, episode_id: str, market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a single episode given the episode's ID, URIs or URL.
 
@@ -311,16 +898,14 @@ def get_episode(token: str, episode_id: str, market: Optional[str] = None) -> Di
     Returns:
         Dictionary containing episode information
     """
-    try:
-        spotify = get_spotify_client(token)
-        episode = spotify.episode(episode_id, market=market)
-        return episode
-
-    except Exception as e:
-        return {"error": f"Failed to get episode: {str(e)}"}
+    session = get_session()
+    episode = await _get(session, f"episodes/{_get_id('episode', episode_id)}", {"market": market}, token)
+    return episode
 
 @mcp.tool()
-def get_episodes(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get episodes")
+@with_backpressure
+async def get_episodes(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a list of episodes given the episode IDs, URIs, or URLs.
 
@@ -332,16 +917,15 @@ def get_episodes(token: str, ids: List[str], market: Optional[str] = None) -> Di
     Returns:
         Dictionary containing episode information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.episodes(ids, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get episodes: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "episodes", "episodes", [_get_id("episode", e) for e in ids], 50, {"market": market}, token)
+    return results
 
 @mcp.tool()
-def get_featured_playlists(token: str, locale: Optional[str] = None, country: Optional[str] = None, timestamp: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get featured playlists")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_featured_playlists(token: str, locale: Optional[str] = None, country: Optional[str] = None, timestamp: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get a list of Spotify featured playlists.
 
@@ -350,20 +934,23 @@ def get_featured_playlists(token: str, locale: Optional[str] = None, country: Op
         country: An ISO 3166-1 alpha-2 country code
         limit: The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50
         offset: The index of the first item to return. Default: 0 (the first object). Use with limit to get the next set of items
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing featured playlists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.featured_playlists(locale=locale, country=country, timestamp=timestamp, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get featured playlists: {str(e)}"}
+    session = get_session()
+    path = "browse/featured-playlists"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"locale": locale, "country": country, "timestamp": timestamp}, token, limit, offset, key="playlists")
+    else:
+        results = await _get_page(session, path, {"locale": locale, "country": country, "timestamp": timestamp, "limit": limit, "offset": offset}, token, key="playlists")
+    return results
 
 @mcp.tool()
-def get_audiobook(token: str, id: str, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get audiobook")
+@with_backpressure
+async def get_audiobook(token: str, id: str, market: Optional[str] = None) -> Dict[str, Any]:
     """
     Get Spotify catalog information for a single audiobook identified by its unique Spotify ID.
 
@@ -375,16 +962,14 @@ def get_audiobook(token: str, id: str, market: Optional[str] = None) -> Dict[str
     Returns:
         Dictionary containing audiobook information
     """
-    try:
-        spotify = get_spotify_client(token)
-        audiobook = spotify.get_audiobook(id, market=market)
-        return audiobook
-
-    except Exception as e:
-        return {"error": f"Failed to get audiobook: {str(e)}"}
+    session = get_session()
+    audiobook = await _get(session, f"audiobooks/{_get_id('audiobook', id)}", {"market": market}, token)
+    return audiobook
 
 @mcp.tool()
-def get_audiobook_chapters(token: str, id: str, market: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get audiobook chapters")
+@with_backpressure
+async def get_audiobook_chapters(token: str, id: str, market: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get Spotify catalog information about an audiobook's chapters.
 
@@ -394,20 +979,23 @@ def get_audiobook_chapters(token: str, id: str, market: Optional[str] = None, li
         limit: The maximum number of items to return
         offset: The index of the first item to return
         market: An ISO 3166-1 alpha-2 country code
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing audiobook chapters
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.get_audiobook_chapters(id, market=market, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get audiobook chapters: {str(e)}"}
+    session = get_session()
+    path = f"audiobooks/{_get_id('audiobook', id)}/chapters"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"market": market, "limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_audiobooks(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get audiobooks")
+@with_backpressure
+async def get_audiobooks(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
     """
     Get Spotify catalog information for multiple audiobooks based on their Spotify IDs.
 
@@ -419,16 +1007,15 @@ def get_audiobooks(token: str, ids: List[str], market: Optional[str] = None) ->
     Returns:
         Dictionary containing audiobook information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.get_audiobooks(ids, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get audiobooks: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "audiobooks", "audiobooks", [_get_id("audiobook", a) for a in ids], 50, {"market": market}, token)
+    return results
 
 @mcp.tool()
-def get_new_releases(token: str, country: Optional[str] = None, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get new releases")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_new_releases(token: str, country: Optional[str] = None, limit: int = 20, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get a list of new album releases featured in Spotify.
 
@@ -437,62 +1024,68 @@ def get_new_releases(token: str, country: Optional[str] = None, limit: int = 20,
         country: An ISO 3166-1 alpha-2 country code
         limit: The maximum number of items to return. Default: 20. Minimum: 1. Maximum: 50
         offset: The index of the first item to return. Default: 0 (the first object). Use with limit to get the next set of items
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing new album releases
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.new_releases(country=country, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get new releases: {str(e)}"}
+    session = get_session()
+    path = "browse/new-releases"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"country": country}, token, limit, offset, key="albums")
+    else:
+        results = await _get_page(session, path, {"country": country, "limit": limit, "offset": offset}, token, key="albums")
+    return results
 
 @mcp.tool()
-def get_playlist_info(token: str, playlist_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get playlist info")
+@with_backpressure
+async def get_playlist_info(token: str, playlist_id: str, fields: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets playlist by id.
 
     Args:
         token: Spotify user token
         playlist_id: The id of the playlist
+        fields: Which fields to return, filtered server-side to cut the payload, e.g. "name,owner(id),tracks.items(track(id,name,artists(id,name),duration_ms))"
 
     Returns:
         Dictionary containing detailed playlist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        playlist = spotify.playlist(playlist_id)
-        return playlist
-
-    except Exception as e:
-        return {"error": f"Failed to get playlist info: {str(e)}"}
+    session = get_session()
+    playlist = await _get(session, f"playlists/{_get_id('playlist', playlist_id)}", {"fields": fields, "additional_types": "track"}, token)
+    return playlist
 
 @mcp.tool()
-def get_playlist_tracks(token: str, playlist_id: str, fields: Optional[str] = None, limit: int = 100, offset: int = 0, market: Optional[str] = None, additional_types: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get playlist tracks")
+@with_backpressure
+async def get_playlist_tracks(token: str, playlist_id: str, fields: Optional[str] = None, limit: int = 100, offset: int = 0, market: Optional[str] = None, additional_types: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get full details of the tracks of a playlist.
 
     Args:
         token: Spotify user token
         playlist_id: The playlist ID, URI or URL
+        fields: Which fields to return, filtered server-side, e.g. "items(track(id,name,artists(id,name),duration_ms)),total". fetch_all adds items and total if they are left out
         limit: The maximum number of tracks to return
         offset: The index of the first track to return
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing playlist tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.playlist_tracks(playlist_id, fields=fields, limit=limit, offset=offset, market=market, additional_types=additional_types)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get playlist tracks: {str(e)}"}
+    session = get_session()
+    path = f"playlists/{_get_id('playlist', playlist_id)}/items"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"fields": fields, "market": market, "additional_types": additional_types or "track"}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"fields": fields, "limit": limit, "offset": offset, "market": market, "additional_types": additional_types or "track"}, token)
+    return results
 
 @mcp.tool()
-def playlist_cover_image(token: str, playlist_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get playlist cover image")
+@with_backpressure
+async def playlist_cover_image(token: str, playlist_id: str) -> Dict[str, Any]:
     """
     Get cover image of a playlist.
 
@@ -503,16 +1096,14 @@ def playlist_cover_image(token: str, playlist_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing playlist cover image information
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.playlist_cover_image(playlist_id)
-        return {"images": result}
-
-    except Exception as e:
-        return {"error": f"Failed to get playlist cover image: {str(e)}"}
+    session = get_session()
+    result = await _get(session, f"playlists/{_get_id('playlist', playlist_id)}/images", None, token)
+    return {"images": result}
 
 @mcp.tool()
-def playlist_is_following(token: str, playlist_id: str, user_ids: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check playlist following status")
+@with_backpressure
+async def playlist_is_following(token: str, playlist_id: str, user_ids: List[str]) -> Dict[str, Any]:
     """
     Check if users follow playlist.
 
@@ -524,16 +1115,14 @@ def playlist_is_following(token: str, playlist_id: str, user_ids: List[str]) ->
     Returns:
         Dictionary containing following status for each user
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.playlist_is_following(playlist_id, user_ids)
-        return {"following": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check playlist following status: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, f"playlists/{_get_id('playlist', playlist_id)}/followers/contains", "ids", user_ids, 5, token)
+    return {"following": result}
 
 @mcp.tool()
-def get_available_genres(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get available genres")
+@with_backpressure
+async def get_available_genres(token: str) -> Dict[str, Any]:
     """
     Get available genres for recommendations.
 
@@ -543,16 +1132,14 @@ def get_available_genres(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing available genres
     """
-    try:
-        spotify = get_spotify_client(token)
-        genres = spotify.recommendation_genre_seeds()
-        return genres
-
-    except Exception as e:
-        return {"error": f"Failed to get available genres: {str(e)}"}
+    session = get_session()
+    genres = await _static(session, "recommendations/available-genre-seeds", token)
+    return genres
 
 @mcp.tool()
-def get_recommendations(token: str, seed_artists: Optional[List[str]] = None, seed_genres: Optional[List[str]] = None,
+@tool_error("Failed to get recommendations")
+@with_backpressure
+async def get_recommendations(token: str, seed_artists: Optional[List[str]] = None, seed_genres: Optional[List[str]] = None,
                       seed_tracks: Optional[List[str]] = None, limit: int = 20, market: Optional[str] = None,
                       min_acousticness: Optional[float] = None, max_acousticness: Optional[float] = None, target_acousticness: Optional[float] = None,
                       min_danceability: Optional[float] = None, max_danceability: Optional[float] = None, target_danceability: Optional[float] = None,
@@ -585,65 +1172,22 @@ def get_recommendations(token: str, seed_artists: Optional[List[str]] = None, se
     Returns:
         Dictionary containing recommended tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-
-        results = spotify.recommendations(
-            seed_artists=seed_artists,
-            seed_genres=seed_genres,
-            seed_tracks=seed_tracks,
-            limit=limit,
-            market=market,
-            min_acousticness=min_acousticness,
-            max_acousticness=max_acousticness,
-            target_acousticness=target_acousticness,
-            min_danceability=min_danceability,
-            max_danceability=max_danceability,
-            target_danceability=target_danceability,
-            min_duration_ms=min_duration_ms,
-            max_duration_ms=max_duration_ms,
-            target_duration_ms=target_duration_ms,
-            min_energy=min_energy,
-            max_energy=max_energy,
-            target_energy=target_energy,
-            min_instrumentalness=min_instrumentalness,
-            max_instrumentalness=max_instrumentalness,
-            target_instrumentalness=target_instrumentalness,
-            min_key=min_key,
-            max_key=max_key,
-            target_key=target_key,
-            min_liveness=min_liveness,
-            max_liveness=max_liveness,
-            target_liveness=target_liveness,
-            min_loudness=min_loudness,
-            max_loudness=max_loudness,
-            target_loudness=target_loudness,
-            min_mode=min_mode,
-            max_mode=max_mode,
-            target_mode=target_mode,
-            min_popularity=min_popularity,
-            max_popularity=max_popularity,
-            target_popularity=target_popularity,
-            min_speechiness=min_speechiness,
-            max_speechiness=max_speechiness,
-            target_speechiness=target_speechiness,
-            min_tempo=min_tempo,
-            max_tempo=max_tempo,
-            target_tempo=target_tempo,
-            min_time_signature=min_time_signature,
-            max_time_signature=max_time_signature,
-            target_time_signature=target_time_signature,
-            min_valence=min_valence,
-            max_valence=max_valence,
-            target_valence=target_valence
-        )
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get recommendations: {str(e)}"}
+    params = {k: v for k, v in locals().items() if v is not None and k not in ("token", "seed_artists", "seed_genres", "seed_tracks")}
+    if seed_artists:
+        params["seed_artists"] = ",".join(_get_id("artist", a) for a in seed_artists)
+    if seed_genres:
+        params["seed_genres"] = ",".join(seed_genres)
+    if seed_tracks:
+        params["seed_tracks"] = ",".join(_get_id("track", t) for t in seed_tracks)
+    session = get_session()
+    results = await _get(session, "recommendations", params, token)
+    return results
 
 @mcp.tool()
-def search_tracks(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Track search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search_tracks(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
     Searches for an item.
 
@@ -656,16 +1200,15 @@ def search_tracks(token: str, query: str, limit: int = 10, offset: int = 0) -> D
     Returns:
         Dictionary containing search results with track information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search(q=query, type="track", limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Track search failed: {str(e)}"}
+    session = get_session()
+    results = await _search(session, query, ["track"], limit, offset, None, token)
+    return results
 
 @mcp.tool()
-def search_artists(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Artist search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search_artists(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
     Searches for an item.
 
@@ -678,16 +1221,15 @@ def search_artists(token: str, query: str, limit: int = 10, offset: int = 0) ->
     Returns:
         Dictionary containing search results with artist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search(q=query, type="artist", limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Artist search failed: {str(e)}"}
+    session = get_session()
+    results = await _search(session, query, ["artist"], limit, offset, None, token)
+    return results
 
 @mcp.tool()
-def search_albums(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Album search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search_albums(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
     Searches for an item.
 
@@ -700,16 +1242,15 @@ def search_albums(token: str, query: str, limit: int = 10, offset: int = 0) -> D
     Returns:
         Dictionary containing search results with album information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search(q=query, type="album", limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Album search failed: {str(e)}"}
+    session = get_session()
+    results = await _search(session, query, ["album"], limit, offset, None, token)
+    return results
 
 @mcp.tool()
-def search_playlists(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Playlist search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search_playlists(token: str, query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
     Searches for an item.
 
@@ -722,16 +1263,37 @@ def search_playlists(token: str, query: str, limit: int = 10, offset: int = 0) -
     Returns:
         Dictionary containing search results with playlist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search(q=query, type="playlist", limit=limit, offset=offset)
-        return results
+    session = get_session()
+    results = await _search(session, query, ["playlist"], limit, offset, None, token)
+    return results
+
+@mcp.tool()
+@tool_error("Search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search(token: str, query: str, types: Optional[List[str]] = None, limit: int = 10, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Searches for several item types with a single request.
+
+    Args:
+        token: Spotify user token
+        query: The search query
+        types: The types of items to return. Any of 'artist', 'album', 'track', 'playlist', 'show', 'episode' and 'audiobook'. Default: ['track', 'artist']
+        limit: The number of items to return (min = 1, default = 10, max = 50). The limit is applied within each type, not on the total response
+        offset: The index of the first item to return
+        market: An ISO 3166-1 alpha-2 country code or the string from_token
 
-    except Exception as e:
-        return {"error": f"Playlist search failed: {str(e)}"}
+    Returns:
+        Dictionary containing one set of search results per requested type
+    """
+    session = get_session()
+    results = await _search(session, query, types or ["track", "artist"], limit, offset, market, token)
+    return results
 
 @mcp.tool()
-def get_show(token: str, show_id: str, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get show")
+@with_backpressure
+async def get_show(token: str, show_id: str, market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a single show given the show's ID, URIs or URL.
 
@@ -743,16 +1305,14 @@ def get_show(token: str, show_id: str, market: Optional[str] = None) -> Dict[str
     Returns:
         Dictionary containing show information
     """
-    try:
-        spotify = get_spotify_client(token)
-        show = spotify.show(show_id, market=market)
-        return show
-
-    except Exception as e:
-        return {"error": f"Failed to get show: {str(e)}"}
+    session = get_session()
+    show = await _get(session, f"shows/{_get_id('show', show_id)}", {"market": market}, token)
+    return show
 
 @mcp.tool()
-def get_show_episodes(token: str, show_id: str, limit: int = 50, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get show episodes")
+@with_backpressure
+async def get_show_episodes(token: str, show_id: str, limit: int = 50, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get Spotify catalog information about a show's episodes.
 
@@ -762,20 +1322,23 @@ def get_show_episodes(token: str, show_id: str, limit: int = 50, offset: int = 0
         limit: The number of items to return
         offset: The index of the first item to return
         market: An ISO 3166-1 alpha-2 country code. Only episodes available in the given market will be returned
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing show episodes
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.show_episodes(show_id, limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get show episodes: {str(e)}"}
+    session = get_session()
+    path = f"shows/{_get_id('show', show_id)}/episodes"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def get_shows(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get shows")
+@with_backpressure
+async def get_shows(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a list of shows given the show IDs, URIs, or URLs.
 
@@ -787,16 +1350,15 @@ def get_shows(token: str, ids: List[str], market: Optional[str] = None) -> Dict[
     Returns:
         Dictionary containing show information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.shows(ids, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get shows: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "shows", "shows", [_get_id("show", s) for s in ids], 50, {"market": market}, token)
+    return results
 
 @mcp.tool()
-def get_track_info(token: str, track_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get track info")
+@ttl_cached(CATALOG_CACHE)
+@with_backpressure
+async def get_track_info(token: str, track_id: str) -> Dict[str, Any]:
     """
     Returns a single track given the track's ID, URI or URL.
 
@@ -807,37 +1369,34 @@ def get_track_info(token: str, track_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing detailed track information
     """
-    try:
-        spotify = get_spotify_client(token)
-        track = spotify.track(track_id)
-        return track
-
-    except Exception as e:
-        return {"error": f"Failed to get track info: {str(e)}"}
+    session = get_session()
+    track = await _get(session, f"tracks/{_get_id('track', track_id)}", None, token)
+    return track
 
 @mcp.tool()
-def get_tracks(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get tracks")
+@with_backpressure
+async def get_tracks(token: str, ids: List[str], market: Optional[str] = None) -> Dict[str, Any]:
     """
     Returns a list of tracks given a list of track IDs, URIs, or URLs.
 
     Args:
         token: Spotify user token
-        ids: A list of spotify URIs, URLs or IDs. Maximum: 50 IDs
+        ids: A list of spotify URIs, URLs or IDs. Lists longer than 50 IDs are fetched in concurrent batches
         market: An ISO 3166-1 alpha-2 country code
 
     Returns:
         Dictionary containing track information
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.tracks(ids, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get tracks: {str(e)}"}
+    session = get_session()
+    results = await _batched(session, "tracks", "tracks", [_get_id("track", t) for t in ids], 50, {"market": market}, token)
+    return results
 
 @mcp.tool()
-def get_user(token: str, user_id: str) -> Dict[str, Any]:
+@tool_error("Failed to get user")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_user(token: str, user_id: str) -> Dict[str, Any]:
     """
     Gets basic profile information about a Spotify User.
 
@@ -848,16 +1407,15 @@ def get_user(token: str, user_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing user profile information
     """
-    try:
-        spotify = get_spotify_client(token)
-        user = spotify.user(user_id)
-        return user
-
-    except Exception as e:
-        return {"error": f"Failed to get user: {str(e)}"}
+    session = get_session()
+    user = await _get(session, f"users/{_get_id('user', user_id)}", None, token)
+    return user
 
 @mcp.tool()
-def get_user_playlists(token: str, user_id: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get user playlists")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_user_playlists(token: str, user_id: str, limit: int = 50, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Gets playlists of a user.
 
@@ -866,20 +1424,22 @@ def get_user_playlists(token: str, user_id: str, limit: int = 50, offset: int =
         user_id: The id of the user
         limit: The number of items to return
         offset: The index of the first item to return
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing user's playlists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.user_playlists(user_id, limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get user playlists: {str(e)}"}
+    session = get_session()
+    path = f"users/{_get_id('user', user_id)}/playlists"
+    if fetch_all:
+        results = await _paginate_all(session, path, None, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_current_playback(token: str, market: Optional[str] = None, additional_types: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get current playback")
+async def get_current_playback(token: str, market: Optional[str] = None, additional_types: Optional[str] = None) -> Dict[str, Any]:
     """
     Get information about user's current playback.
 
@@ -891,16 +1451,14 @@ def get_current_playback(token: str, market: Optional[str] = None, additional_ty
     Returns:
         Dictionary containing current playback information
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_playback(market=market, additional_types=additional_types)
-        return result if result else {"playback": None}
-
-    except Exception as e:
-        return {"error": f"Failed to get current playback: {str(e)}"}
+    result = await _player_state(token, market, additional_types)
+    return result if result else {"playback": None}
 
 @mcp.tool()
-def get_current_user(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get current user")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_current_user(token: str) -> Dict[str, Any]:
     """
     Get detailed profile information about the current user.
 
@@ -910,16 +1468,14 @@ def get_current_user(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing current user profile information
     """
-    try:
-        spotify = get_spotify_client(token)
-        user = spotify.current_user()
-        return user
-
-    except Exception as e:
-        return {"error": f"Failed to get current user: {str(e)}"}
+    session = get_session()
+    user = await _get(session, "me", None, token)
+    return user
 
 @mcp.tool()
-def get_current_user_followed_artists(token: str, limit: int = 20, after: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get followed artists")
+@with_backpressure
+async def get_current_user_followed_artists(token: str, limit: int = 20, after: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets a list of the artists followed by the current authorized user.
 
@@ -931,16 +1487,14 @@ def get_current_user_followed_artists(token: str, limit: int = 20, after: Option
     Returns:
         Dictionary containing followed artists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_followed_artists(limit=limit, after=after)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get followed artists: {str(e)}"}
+    session = get_session()
+    results = await _get(session, "me/following", {"type": "artist", "limit": limit, "after": after}, token)
+    return results
 
 @mcp.tool()
-def check_current_user_following_artists(token: str, ids: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check if following artists")
+@with_backpressure
+async def check_current_user_following_artists(token: str, ids: List[str]) -> Dict[str, Any]:
     """
     Check if the current user is following certain artists.
 
@@ -951,16 +1505,14 @@ def check_current_user_following_artists(token: str, ids: List[str]) -> Dict[str
     Returns:
         Dictionary containing list of booleans respective to ids
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_following_artists(ids=ids)
-        return {"following": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check if following artists: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/library/contains", "uris", [_get_uri("artist", i) for i in ids], 40, token)
+    return {"following": result}
 
 @mcp.tool()
-def check_current_user_following_users(token: str, ids: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check if following users")
+@with_backpressure
+async def check_current_user_following_users(token: str, ids: List[str]) -> Dict[str, Any]:
     """
     Check if the current user is following certain users.
 
@@ -971,16 +1523,13 @@ def check_current_user_following_users(token: str, ids: List[str]) -> Dict[str,
     Returns:
         Dictionary containing list of booleans respective to ids
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_following_users(ids=ids)
-        return {"following": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check if following users: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/library/contains", "uris", [_get_uri("user", i) for i in ids], 40, token)
+    return {"following": result}
 
 @mcp.tool()
-def get_current_user_playing_track(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get currently playing track")
+async def get_current_user_playing_track(token: str) -> Dict[str, Any]:
     """
     Get information about the current users currently playing track.
 
@@ -990,16 +1539,13 @@ def get_current_user_playing_track(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing currently playing track information
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_playing_track()
-        return result if result else {"track": None}
-
-    except Exception as e:
-        return {"error": f"Failed to get currently playing track: {str(e)}"}
+    result = await _currently_playing(token, None, "track")
+    return result if result else {"track": None}
 
 @mcp.tool()
-def get_current_user_playlists(token: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+@tool_error("Failed to get current user playlists")
+@with_backpressure
+async def get_current_user_playlists(token: str, limit: int = 50, offset: int = 0, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get current user playlists without required getting his profile.
 
@@ -1007,20 +1553,23 @@ def get_current_user_playlists(token: str, limit: int = 50, offset: int = 0) ->
         token: Spotify user token
         limit: The number of items to return
         offset: The index of the first item to return
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing current user's playlists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_playlists(limit=limit, offset=offset)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get current user playlists: {str(e)}"}
+    session = get_session()
+    path = "me/playlists"
+    if fetch_all:
+        results = await _paginate_all(session, path, None, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_current_user_recently_played(token: str, limit: int = 50, after: Optional[int] = None, before: Optional[int] = None) -> Dict[str, Any]:
+@tool_error("Failed to get recently played tracks")
+@with_backpressure
+async def get_current_user_recently_played(token: str, limit: int = 50, after: Optional[int] = None, before: Optional[int] = None) -> Dict[str, Any]:
     """
     Get the current user's recently played tracks.
 
@@ -1033,16 +1582,14 @@ def get_current_user_recently_played(token: str, limit: int = 50, after: Optiona
     Returns:
         Dictionary containing recently played tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_recently_played(limit=limit, after=after, before=before)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get recently played tracks: {str(e)}"}
+    session = get_session()
+    results = await _get(session, "me/player/recently-played", {"limit": limit, "after": after, "before": before}, token)
+    return results
 
 @mcp.tool()
-def get_current_user_saved_albums(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get saved albums")
+@with_backpressure
+async def get_current_user_saved_albums(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Gets a list of the albums saved in the current authorized user's "Your Music" library.
 
@@ -1051,20 +1598,23 @@ def get_current_user_saved_albums(token: str, limit: int = 20, offset: int = 0,
         limit: The number of albums to return (MAX_LIMIT=50)
         offset: The index of the first album to return
         market: An ISO 3166-1 alpha-2 country code
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing saved albums
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_saved_albums(limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get saved albums: {str(e)}"}
+    session = get_session()
+    path = "me/albums"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def check_current_user_saved_albums(token: str, albums: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check saved albums")
+@with_backpressure
+async def check_current_user_saved_albums(token: str, albums: List[str]) -> Dict[str, Any]:
     """
     Check if one or more albums is already saved in the current Spotify user's "Your Music" library.
 
@@ -1075,16 +1625,14 @@ def check_current_user_saved_albums(token: str, albums: List[str]) -> Dict[str,
     Returns:
         Dictionary containing list of booleans indicating if albums are saved
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_saved_albums_contains(albums=albums)
-        return {"saved": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check saved albums: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/library/contains", "uris", [_get_uri("album", a) for a in albums], 40, token)
+    return {"saved": result}
 
 @mcp.tool()
-def get_current_user_saved_episodes(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get saved episodes")
+@with_backpressure
+async def get_current_user_saved_episodes(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Gets a list of the episodes saved in the current authorized user's "Your Music" library.
 
@@ -1093,20 +1641,23 @@ def get_current_user_saved_episodes(token: str, limit: int = 20, offset: int = 0
         limit: The number of episodes to return
         offset: The index of the first episode to return
         market: An ISO 3166-1 alpha-2 country code
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing saved episodes
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_saved_episodes(limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get saved episodes: {str(e)}"}
+    session = get_session()
+    path = "me/episodes"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def check_current_user_saved_episodes(token: str, episodes: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check saved episodes")
+@with_backpressure
+async def check_current_user_saved_episodes(token: str, episodes: List[str]) -> Dict[str, Any]:
     """
     Check if one or more episodes is already saved in the current Spotify user's "Your Music" library.
 
@@ -1117,16 +1668,14 @@ def check_current_user_saved_episodes(token: str, episodes: List[str]) -> Dict[s
     Returns:
         Dictionary containing list of booleans indicating if episodes are saved
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_saved_episodes_contains(episodes=episodes)
-        return {"saved": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check saved episodes: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/episodes/contains", "ids", [_get_id("episode", e) for e in episodes], 50, token)
+    return {"saved": result}
 
 @mcp.tool()
-def get_current_user_saved_shows(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get saved shows")
+@with_backpressure
+async def get_current_user_saved_shows(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Gets a list of the shows saved in the current authorized user's "Your Music" library.
 
@@ -1135,20 +1684,23 @@ def get_current_user_saved_shows(token: str, limit: int = 20, offset: int = 0, m
         limit: The number of shows to return
         offset: The index of the first show to return
         market: An ISO 3166-1 alpha-2 country code
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing saved shows
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_saved_shows(limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get saved shows: {str(e)}"}
+    session = get_session()
+    path = "me/shows"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def check_current_user_saved_shows(token: str, shows: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check saved shows")
+@with_backpressure
+async def check_current_user_saved_shows(token: str, shows: List[str]) -> Dict[str, Any]:
     """
     Check if one or more shows is already saved in the current Spotify user's "Your Music" library.
 
@@ -1159,16 +1711,14 @@ def check_current_user_saved_shows(token: str, shows: List[str]) -> Dict[str, An
     Returns:
         Dictionary containing list of booleans indicating if shows are saved
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_saved_shows_contains(shows=shows)
-        return {"saved": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check saved shows: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/library/contains", "uris", [_get_uri("show", s) for s in shows], 40, token)
+    return {"saved": result}
 
 @mcp.tool()
-def get_current_user_saved_tracks(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get saved tracks")
+@with_backpressure
+async def get_current_user_saved_tracks(token: str, limit: int = 20, offset: int = 0, market: Optional[str] = None, fetch_all: bool = False) -> Dict[str, Any]:
     """
     Gets a list of the tracks saved in the current authorized user's "Your Music" library.
 
@@ -1177,20 +1727,23 @@ def get_current_user_saved_tracks(token: str, limit: int = 20, offset: int = 0,
         limit: The number of tracks to return
         offset: The index of the first track to return
         market: An ISO 3166-1 alpha-2 country code
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing saved tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_saved_tracks(limit=limit, offset=offset, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get saved tracks: {str(e)}"}
+    session = get_session()
+    path = "me/tracks"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"market": market}, token, limit, offset)
+    else:
+        results = await _get(session, path, {"limit": limit, "offset": offset, "market": market}, token)
+    return results
 
 @mcp.tool()
-def check_current_user_saved_tracks(token: str, tracks: List[str]) -> Dict[str, Any]:
+@tool_error("Failed to check saved tracks")
+@with_backpressure
+async def check_current_user_saved_tracks(token: str, tracks: List[str]) -> Dict[str, Any]:
     """
     Check if one or more tracks is already saved in the current Spotify user's "Your Music" library.
 
@@ -1201,16 +1754,15 @@ def check_current_user_saved_tracks(token: str, tracks: List[str]) -> Dict[str,
     Returns:
         Dictionary containing list of booleans indicating if tracks are saved
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.current_user_saved_tracks_contains(tracks=tracks)
-        return {"saved": result}
-
-    except Exception as e:
-        return {"error": f"Failed to check saved tracks: {str(e)}"}
+    session = get_session()
+    result = await _contains(session, "me/library/contains", "uris", [_get_uri("track", t) for t in tracks], 40, token)
+    return {"saved": result}
 
 @mcp.tool()
-def get_current_user_top_artists(token: str, limit: int = 20, offset: int = 0, time_range: str = "medium_term") -> Dict[str, Any]:
+@tool_error("Failed to get top artists")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_current_user_top_artists(token: str, limit: int = 20, offset: int = 0, time_range: str = "medium_term") -> Dict[str, Any]:
     """
     Get the current user's top artists.
 
@@ -1223,16 +1775,15 @@ def get_current_user_top_artists(token: str, limit: int = 20, offset: int = 0, t
     Returns:
         Dictionary containing top artists
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_top_artists(limit=limit, offset=offset, time_range=time_range)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get top artists: {str(e)}"}
+    session = get_session()
+    results = await _get(session, "me/top/artists", {"time_range": time_range, "limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_current_user_top_tracks(token: str, limit: int = 20, offset: int = 0, time_range: str = "medium_term") -> Dict[str, Any]:
+@tool_error("Failed to get top tracks")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_current_user_top_tracks(token: str, limit: int = 20, offset: int = 0, time_range: str = "medium_term") -> Dict[str, Any]:
     """
     Get the current user's top tracks.
 
@@ -1245,16 +1796,13 @@ def get_current_user_top_tracks(token: str, limit: int = 20, offset: int = 0, ti
     Returns:
         Dictionary containing top tracks
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.current_user_top_tracks(limit=limit, offset=offset, time_range=time_range)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get top tracks: {str(e)}"}
+    session = get_session()
+    results = await _get(session, "me/top/tracks", {"time_range": time_range, "limit": limit, "offset": offset}, token)
+    return results
 
 @mcp.tool()
-def get_currently_playing(token: str, market: Optional[str] = None, additional_types: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get currently playing")
+async def get_currently_playing(token: str, market: Optional[str] = None, additional_types: Optional[str] = None) -> Dict[str, Any]:
     """
     Get user's currently playing track.
 
@@ -1266,16 +1814,14 @@ def get_currently_playing(token: str, market: Optional[str] = None, additional_t
     Returns:
         Dictionary containing currently playing track information
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.currently_playing(market=market, additional_types=additional_types)
-        return result if result else {"currently_playing": None}
-
-    except Exception as e:
-        return {"error": f"Failed to get currently playing: {str(e)}"}
+    result = await _currently_playing(token, market, additional_types)
+    return result if result else {"currently_playing": None}
 
 @mcp.tool()
-def get_devices(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get devices")
+@ttl_cached(PLAYER_CACHE)
+@with_backpressure
+async def get_devices(token: str) -> Dict[str, Any]:
     """
     Get a list of user's available devices.
 
@@ -1285,42 +1831,43 @@ def get_devices(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing available devices
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.devices()
-        return result
-
-    except Exception as e:
-        return {"error": f"Failed to get devices: {str(e)}"}
+    session = get_session()
+    result = await _get(session, "me/player/devices", None, token)
+    return result
 
 @mcp.tool()
-def get_playlist_items(token: str, playlist_id: str, fields: Optional[str] = None, limit: int = 100, offset: int = 0, market: Optional[str] = None, additional_types: str = "track,episode") -> Dict[str, Any]:
+@tool_error("Failed to get playlist items")
+@with_backpressure
+async def get_playlist_items(token: str, playlist_id: str, fields: Optional[str] = PLAYLIST_ITEM_FIELDS, limit: int = 100, offset: int = 0, market: Optional[str] = None, additional_types: str = "track,episode", fetch_all: bool = False) -> Dict[str, Any]:
     """
     Get full details of the tracks and episodes of a playlist.
 
     Args:
         token: Spotify user token
         playlist_id: The playlist ID, URI or URL
-        fields: Which fields to return
+        fields: Which fields to return, filtered server-side. Defaults to a trimmed projection (id, uri, type, name, artists, duration and album of each track, or show of each episode); pass an empty string for the full item objects
         limit: The maximum number of tracks to return
         offset: The index of the first track to return
         market: An ISO 3166-1 alpha-2 country code
         additional_types: List of item types to return. Valid types are: track and episode
+        fetch_all: Fetch all pages from offset onwards concurrently and merge them into one page, using limit as the page size
 
     Returns:
         Dictionary containing playlist items
     """
-    try:
-        spotify = get_spotify_client(token)
-        additional_types_tuple = tuple(additional_types.split(",")) if additional_types else ("track", "episode")
-        results = spotify.playlist_items(playlist_id, fields=fields, limit=limit, offset=offset, market=market, additional_types=additional_types_tuple)
-        return results
-
-    except Exception as e:
-        return {"error": f"Failed to get playlist items: {str(e)}"}
+    session = get_session()
+    path = f"playlists/{_get_id('playlist', playlist_id)}/items"
+    if fetch_all:
+        results = await _paginate_all(session, path, {"fields": fields or None, "market": market, "additional_types": additional_types or "track,episode"}, token, limit, offset)
+    else:
+        results = await _get_page(session, path, {"fields": fields or None, "limit": limit, "offset": offset, "market": market, "additional_types": additional_types or "track,episode"}, token)
+    return results
 
 @mcp.tool()
-def get_queue(token: str) -> Dict[str, Any]:
+@tool_error("Failed to get queue")
+@ttl_cached(PLAYER_CACHE)
+@with_backpressure
+async def get_queue(token: str) -> Dict[str, Any]:
     """
     Gets the current user's queue.
 
@@ -1330,16 +1877,15 @@ def get_queue(token: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing user's queue
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.queue()
-        return result
-
-    except Exception as e:
-        return {"error": f"Failed to get queue: {str(e)}"}
+    session = get_session()
+    result = await _get(session, "me/player/queue", None, token)
+    return result
 
 @mcp.tool()
-def search_general(token: str, query: str, limit: int = 10, offset: int = 0, type: str = "track", market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Search failed")
+@ttl_cached(SEARCH_CACHE, query=_normalize_query)
+@with_backpressure
+async def search_general(token: str, query: str, limit: int = 10, offset: int = 0, type: str = "track", market: Optional[str] = None) -> Dict[str, Any]:
     """
     Searches for an item.
 
@@ -1354,16 +1900,14 @@ def search_general(token: str, query: str, limit: int = 10, offset: int = 0, typ
     Returns:
         Dictionary containing search results
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search(q=query, limit=limit, offset=offset, type=type, market=market)
-        return results
-
-    except Exception as e:
-        return {"error": f"Search failed: {str(e)}"}
+    session = get_session()
+    results = await _search(session, query, type.split(","), limit, offset, market, token)
+    return results
 
 @mcp.tool()
-def search_markets(token: str, query: str, limit: int = 10, offset: int = 0, type: str = "track", markets: Optional[List[str]] = None, total: Optional[int] = None) -> Dict[str, Any]:
+@tool_error("Multi-market search failed")
+@with_backpressure
+async def search_markets(token: str, query: str, limit: int = 10, offset: int = 0, type: str = "track", markets: Optional[List[str]] = None, total: Optional[int] = None) -> Dict[str, Any]:
     """
     (experimental) Searches multiple markets for an item.
 
@@ -1379,16 +1923,15 @@ def search_markets(token: str, query: str, limit: int = 10, offset: int = 0, typ
     Returns:
         Dictionary containing search results across multiple markets
     """
-    try:
-        spotify = get_spotify_client(token)
-        results = spotify.search_markets(q=query, limit=limit, offset=offset, type=type, markets=markets, total=total)
-        return results
-
-    except Exception as e:
-        return {"error": f"Multi-market search failed: {str(e)}"}
+    session = get_session()
+    results = await _search_multiple_markets(session, query, limit, offset, type, markets or list(COUNTRY_CODES), total, token)
+    return results
 
 @mcp.tool()
-def get_user_playlist(token: str, user_id: str, playlist_id: str, fields: Optional[str] = None, market: Optional[str] = None) -> Dict[str, Any]:
+@tool_error("Failed to get user playlist")
+@ttl_cached(USER_CACHE)
+@with_backpressure
+async def get_user_playlist(token: str, user_id: str, playlist_id: str, fields: Optional[str] = PLAYLIST_FIELDS, market: Optional[str] = None) -> Dict[str, Any]:
     """
     Gets a specific user playlist.
 
@@ -1396,19 +1939,27 @@ def get_user_playlist(token: str, user_id: str, playlist_id: str, fields: Option
         token: Spotify user token
         user_id: The user ID
         playlist_id: The playlist ID
-        fields: Which fields to return
+        fields: Which fields to return, filtered server-side. Defaults to a trimmed projection (id, name, description, owner, snapshot and a trimmed first page of items); pass an empty string for the full playlist object
         market: An ISO 3166-1 alpha-2 country code
 
     Returns:
         Dictionary containing user playlist information
     """
-    try:
-        spotify = get_spotify_client(token)
-        result = spotify.user_playlist(user_id, playlist_id, fields=fields, market=market)
-        return result
-
-    except Exception as e:
-        return {"error": f"Failed to get user playlist: {str(e)}"}
+    session = get_session()
+    result = await _get(session, f"playlists/{_get_id('playlist', playlist_id)}", {"fields": fields or None, "market": market, "additional_types": "track"}, token)
+    return result
 
 if __name__ == "__main__":
-    mcp.run(transport="http", host="127.0.0.1", port=8080)
\ No newline at end of file
+    # Run the server on uvloop when it is installed, through anyio's loop_factory
+    # rather than the deprecated event loop policy API.
+    try:
+        import uvloop
+        backend_options = {"loop_factory": uvloop.new_event_loop}
+    except ImportError:
+        backend_options = {}
+    # JSON (not SSE) responses let GZipMiddleware compress large tool results.
+    anyio.run(
+        functools.partial(mcp.run_async, "http", host="127.0.0.1", port=8080, json_response=True, middleware=[Middleware(GZipMiddleware, minimum_size=1024)]),
+        backend="asyncio",
+        backend_options=backend_options,
+    )
\ No newline at end of file